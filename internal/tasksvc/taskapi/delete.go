@@ -66,8 +66,8 @@ func (h DeleteHandler) Handle(
 		}); err != nil {
 			w.WriteHeader(http.StatusInternalServerError)
 			h.log.Error(err)
-			return
 		}
+		return
 	}
 
 	// validate user is admin
@@ -78,8 +78,8 @@ func (h DeleteHandler) Handle(
 		}); err != nil {
 			w.WriteHeader(http.StatusInternalServerError)
 			h.log.Error(err)
-			return
 		}
+		return
 	}
 
 	// delete task from the task table
@@ -45,20 +45,30 @@ func TestDeleteHandler(t *testing.T) {
 			authToken:     "nonempty",
 			errDecodeAuth: errors.New("decode auth failed"),
 			auth:          cookie.Auth{},
-			errDeleteTask: nil,
+			errDeleteTask: errors.New("delete task failed"),
 			wantStatus:    http.StatusUnauthorized,
-			assertFunc:    assert.OnRespErr("Invalid auth token."),
+			assertFunc: func(t *testing.T, r *http.Response, args []any) {
+				assert.OnRespErr("Invalid auth token.")(t, r, args)
+
+				// task deleter must not be reached
+				assert.Equal(t.Error, len(args), 0)
+			},
 		},
 		{
 			name:          "NotAdmin",
 			authToken:     "nonempty",
 			errDecodeAuth: nil,
 			auth:          cookie.Auth{IsAdmin: false},
-			errDeleteTask: nil,
+			errDeleteTask: errors.New("delete task failed"),
 			wantStatus:    http.StatusForbidden,
-			assertFunc: assert.OnRespErr(
-				"Only team admins can delete tasks.",
-			),
+			assertFunc: func(t *testing.T, r *http.Response, args []any) {
+				assert.OnRespErr(
+					"Only team admins can delete tasks.",
+				)(t, r, args)
+
+				// task deleter must not be reached
+				assert.Equal(t.Error, len(args), 0)
+			},
 		},
 		{
 			name:          "NotFound",
@@ -92,6 +102,7 @@ func TestDeleteHandler(t *testing.T) {
 			authDecoder.Res = c.auth
 			authDecoder.Err = c.errDecodeAuth
 			taskDeleter.Err = c.errDeleteTask
+			log.Args = nil
 
 			r := httptest.NewRequest("", "/?id=foo", nil)
 			if c.authToken != "" {
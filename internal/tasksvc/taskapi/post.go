@@ -143,20 +143,24 @@ func (h *PostHandler) Handle(
 		return
 	}
 
-	// insert a new task into the task table - retry up to 3 times for the
-	// unlikely event that the generated UUID is a duplicate
+	// insert a new task into the task table along with all of its subtasks in
+	// a single write - retry up to 3 times with a new ID for the unlikely event
+	// that the generated UUID is a duplicate
+	task := tasktbl.NewTask(
+		auth.TeamID,
+		req.BoardID,
+		req.ColNo,
+		"",
+		req.Title,
+		req.Description,
+		req.Order,
+		req.Subtasks,
+	)
 	for i := 0; i < 3; i++ {
-		id := uuid.NewString()
-		if err = h.taskInserter.Insert(r.Context(), tasktbl.NewTask(
-			auth.TeamID,
-			req.BoardID,
-			req.ColNo,
-			id,
-			req.Title,
-			req.Description,
-			req.Order,
-			req.Subtasks,
-		)); !errors.Is(err, db.ErrDupKey) {
+		task.ID = uuid.NewString()
+		if err = h.taskInserter.Insert(
+			r.Context(), task,
+		); !errors.Is(err, db.ErrDupKey) {
 			break
 		}
 	}
@@ -132,16 +132,12 @@ func (h GetHandler) getByTeamID(
 	}
 
 	// if more than one task, only return the ones with the first task's board
-	// ID
+	// ID, filtering them in place rather than copying them into a new slice
 	if len(tasks) > 1 {
-		singleBoardTasks := []tasktbl.Task{}
-		var boardID string
+		singleBoardTasks := tasks[:0]
+		boardID := tasks[0].BoardID
 		for _, t := range tasks {
-			switch boardID {
-			case "":
-				boardID = t.BoardID
-				singleBoardTasks = append(singleBoardTasks, t)
-			case t.BoardID:
+			if t.BoardID == boardID {
 				singleBoardTasks = append(singleBoardTasks, t)
 			}
 		}
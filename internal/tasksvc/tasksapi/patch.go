@@ -80,8 +80,8 @@ func (h PatchHandler) Handle(
 		}); err != nil {
 			w.WriteHeader(http.StatusInternalServerError)
 			h.log.Error(err)
-			return
 		}
+		return
 	}
 
 	// validate user is admin
@@ -92,8 +92,8 @@ func (h PatchHandler) Handle(
 		}); err != nil {
 			w.WriteHeader(http.StatusInternalServerError)
 			h.log.Error(err)
-			return
 		}
+		return
 	}
 
 	// decode request body
@@ -115,11 +115,12 @@ func (h PatchHandler) Handle(
 		return
 	}
 
-	// map request body into tasks, validating them as we go
-	var tasks []tasktbl.Task
-	for _, t := range req {
+	// validate the tasks in the request body in a single pass, setting their
+	// team ID in place rather than copying each into a new task
+	tasks := []tasktbl.Task(req)
+	for i := range tasks {
 		// TODO: validate other fields, too
-		if err := h.colNoValidator.Validate(t.ColNo); err != nil {
+		if err := h.colNoValidator.Validate(tasks[i].ColNo); err != nil {
 			w.WriteHeader(http.StatusBadRequest)
 			if err = json.NewEncoder(w).Encode(PatchResp{
 				Error: "Invalid column number.",
@@ -130,18 +131,7 @@ func (h PatchHandler) Handle(
 			return
 		}
 
-		task := tasktbl.Task{
-			TeamID:      auth.TeamID,
-			BoardID:     t.BoardID,
-			ColNo:       t.ColNo,
-			ID:          t.ID,
-			Title:       t.Title,
-			Description: t.Description,
-			Order:       t.Order,
-			Subtasks:    t.Subtasks,
-		}
-
-		tasks = append(tasks, task)
+		tasks[i].TeamID = auth.TeamID
 	}
 
 	// update tasks in the task table
@@ -57,31 +57,41 @@ func TestPatchHandler(t *testing.T) {
 		},
 		{
 			name:             "ErrDecodeAuth",
-			rBody:            "[]",
+			rBody:            `[{"id": "taskid", "order": 3, "column": 0}]`,
 			authToken:        "nonempty",
 			errDecodeAuth:    errors.New("decode auth failed"),
 			authDecoded:      cookie.Auth{},
 			errValidateColNo: nil,
-			errUpdateTasks:   nil,
+			errUpdateTasks:   errors.New("update tasks failed"),
 			errEncodeState:   nil,
 			outState:         http.Cookie{},
 			wantStatus:       http.StatusUnauthorized,
-			assertFunc:       assert.OnRespErr("Invalid auth token."),
+			assertFunc: func(t *testing.T, r *http.Response, args []any) {
+				assert.OnRespErr("Invalid auth token.")(t, r, args)
+
+				// tasks updater must not be reached
+				assert.Equal(t.Error, len(args), 0)
+			},
 		},
 		{
 			name:             "NotAdmin",
-			rBody:            "[]",
+			rBody:            `[{"id": "taskid", "order": 3, "column": 0}]`,
 			authToken:        "nonempty",
 			errDecodeAuth:    nil,
 			authDecoded:      cookie.Auth{IsAdmin: false},
 			errValidateColNo: nil,
-			errUpdateTasks:   nil,
+			errUpdateTasks:   errors.New("update tasks failed"),
 			errEncodeState:   nil,
 			outState:         http.Cookie{},
 			wantStatus:       http.StatusForbidden,
-			assertFunc: assert.OnRespErr(
-				"Only team admins can edit tasks.",
-			),
+			assertFunc: func(t *testing.T, r *http.Response, args []any) {
+				assert.OnRespErr(
+					"Only team admins can edit tasks.",
+				)(t, r, args)
+
+				// tasks updater must not be reached
+				assert.Equal(t.Error, len(args), 0)
+			},
 		},
 		{
 			name:             "NoTasks",
@@ -154,6 +164,7 @@ func TestPatchHandler(t *testing.T) {
 			authDecoder.Err = c.errDecodeAuth
 			colNoVdtor.Err = c.errValidateColNo
 			tasksUpdater.Err = c.errUpdateTasks
+			log.Args = nil
 			w := httptest.NewRecorder()
 			r := httptest.NewRequest("", "/", strings.NewReader(c.rBody))
 			if c.authToken != "" {
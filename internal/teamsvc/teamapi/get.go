@@ -86,24 +86,28 @@ func (h GetHandler) Handle(w http.ResponseWriter, r *http.Request, _ string) {
 			},
 		)
 
-		// retry a couple of times in the unlitekly event of GUID collision
-		for i := 0; i < 3; i++ {
-			// insert team into the team table
-			if err = h.teamInserter.Insert(
-				r.Context(), team,
-			); errors.Is(err, db.ErrDupKey) {
-				team.Boards[0].ID = uuid.NewString()
-			} else if err != nil {
+		// insert team into the team table along with its default board in a
+		// single write - the board ID is not a key in the team table so no
+		// retries are needed for GUID collision
+		err = h.teamInserter.Insert(r.Context(), team)
+		if errors.Is(err, db.ErrDupKey) {
+			// the team was inserted by a concurrent request (e.g. the app
+			// being loaded in two tabs at once) so retrieve and return it
+			team, err = h.teamRetriever.Retrieve(r.Context(), auth.TeamID)
+			if err != nil {
 				w.WriteHeader(http.StatusInternalServerError)
 				h.log.Error(err)
 				return
-			} else {
-				break
 			}
+			status = http.StatusOK
+		} else if err != nil {
+			w.WriteHeader(http.StatusInternalServerError)
+			h.log.Error(err)
+			return
+		} else {
+			// write 201 to indicate creation of the new team
+			status = http.StatusCreated
 		}
-
-		// write 201 to indicate creation of the new team
-		status = http.StatusCreated
 	} else if err != nil {
 		w.WriteHeader(http.StatusInternalServerError)
 		h.log.Error(err)
@@ -131,8 +135,10 @@ func (h GetHandler) Handle(w http.ResponseWriter, r *http.Request, _ string) {
 				}
 			}
 
-			// return only the boards the user is a member of
-			var boards []teamtbl.Board
+			// return only the boards the user is a member of - the filtered
+			// slice is allocated once with room for all boards and is never
+			// nil so that no boards are encoded as [] and not null
+			boards := make([]teamtbl.Board, 0, len(team.Boards))
 			for _, b := range team.Boards {
 				for _, m := range b.Members {
 					if m == auth.Username {
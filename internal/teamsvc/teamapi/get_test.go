@@ -5,8 +5,10 @@ package teamapi
 import (
 	"encoding/json"
 	"errors"
+	"io"
 	"net/http"
 	"net/http/httptest"
+	"strings"
 	"testing"
 
 	"github.com/kxplxn/goteam/pkg/assert"
@@ -126,6 +128,20 @@ func TestGetHandler(t *testing.T) {
 			wantStatus:      http.StatusInternalServerError,
 			assertFunc:      assert.OnLoggedErr("insert failed"),
 		},
+		{
+			name:            "ErrRetrieveAfterDupKey",
+			auth:            "nonempty",
+			errDecodeAuth:   nil,
+			authDecoded:     cookie.Auth{IsAdmin: true},
+			errRetrieve:     db.ErrNoItem,
+			team:            teamtbl.Team{},
+			errInsert:       db.ErrDupKey,
+			errUpdate:       nil,
+			errEncodeInvite: nil,
+			inviteEncoded:   http.Cookie{},
+			wantStatus:      http.StatusInternalServerError,
+			assertFunc:      assert.OnLoggedErr(db.ErrNoItem.Error()),
+		},
 		{
 			name:            "ErrUpdate",
 			auth:            "nonempty",
@@ -265,8 +281,12 @@ func TestGetHandler(t *testing.T) {
 			inviteEncoded:   http.Cookie{},
 			wantStatus:      http.StatusOK,
 			assertFunc: func(t *testing.T, resp *http.Response, _ []any) {
+				body, err := io.ReadAll(resp.Body)
+				if err != nil {
+					t.Fatal(err)
+				}
 				var team teamtbl.Team
-				if err := json.NewDecoder(resp.Body).Decode(&team); err != nil {
+				if err := json.Unmarshal(body, &team); err != nil {
 					t.Fatal(err)
 				}
 
@@ -275,13 +295,43 @@ func TestGetHandler(t *testing.T) {
 					team.Members, append(wantTeam.Members, "newuser"),
 				)
 
-				// since the user is not yet a member of any boards, no boards
-				assert.Equal(t.Error, len(team.Boards), 0)
+				// since the user is not yet a member of any boards, boards
+				// should be empty and not null
+				assert.True(t.Error,
+					strings.Contains(string(body), `"boards":[]`),
+				)
 
 				// no invite cookie should be set for non-admin
 				assert.Equal(t.Error, len(resp.Cookies()), 0)
 			},
 		},
+		{
+			name:          "OKMemberNoBoards",
+			auth:          "nonempty",
+			errDecodeAuth: nil,
+			authDecoded:   cookie.Auth{IsAdmin: false, Username: "memberone"},
+			errRetrieve:   nil,
+			team: teamtbl.Team{
+				ID: "teamid", Members: []string{"memberone"},
+			},
+			errInsert:       nil,
+			errUpdate:       nil,
+			errEncodeInvite: nil,
+			inviteEncoded:   http.Cookie{},
+			wantStatus:      http.StatusOK,
+			assertFunc: func(t *testing.T, resp *http.Response, _ []any) {
+				body, err := io.ReadAll(resp.Body)
+				if err != nil {
+					t.Fatal(err)
+				}
+
+				// since the team has no boards, boards should be empty and not
+				// null
+				assert.True(t.Error,
+					strings.Contains(string(body), `"boards":[]`),
+				)
+			},
+		},
 	} {
 		t.Run(c.name, func(t *testing.T) {
 			authDecoder.Err = c.errDecodeAuth
@@ -305,4 +355,42 @@ func TestGetHandler(t *testing.T) {
 			c.assertFunc(t, resp, log.Args)
 		})
 	}
+
+	t.Run("OKAdminConcurrentNewTeam", func(t *testing.T) {
+		// the first retrieve finds no team but the insert reports that it was
+		// inserted by a concurrent request in the meantime
+		teamRetriever := &db.FakeRetrieverSeq[teamtbl.Team]{
+			Res:  []teamtbl.Team{{}, wantTeam},
+			Errs: []error{db.ErrNoItem, nil},
+		}
+		authDecoder.Err = nil
+		authDecoder.Res = cookie.Auth{IsAdmin: true, Username: "memberone"}
+		teamInserter.Err = db.ErrDupKey
+		inviteEncoder.Err = nil
+		inviteEncoder.Res = http.Cookie{Name: "invite-token", Value: "aksdfj"}
+		sut := NewGetHandler(
+			authDecoder,
+			teamRetriever,
+			teamInserter,
+			teamUpdater,
+			inviteEncoder,
+			log,
+		)
+		w := httptest.NewRecorder()
+		r := httptest.NewRequest(http.MethodGet, "/", nil)
+		r.AddCookie(&http.Cookie{Name: "auth-token", Value: "nonempty"})
+
+		sut.Handle(w, r, "")
+
+		// the team inserted by the concurrent request should be returned
+		resp := w.Result()
+		assert.Equal(t.Error, resp.StatusCode, http.StatusOK)
+		var team teamtbl.Team
+		if err := json.NewDecoder(resp.Body).Decode(&team); err != nil {
+			t.Fatal(err)
+		}
+		assert.Equal(t.Error, team.ID, wantTeam.ID)
+		assert.AllEqual(t.Error, team.Members, wantTeam.Members)
+		assert.Equal(t.Error, len(team.Boards), len(wantTeam.Boards))
+	})
 }
@@ -3,6 +3,8 @@ package api
 import (
 	"net/http"
 	"os"
+	"sort"
+	"strings"
 )
 
 // MethodHandler describes a type that can be used to serve a certain part of an
@@ -14,27 +16,39 @@ type MethodHandler interface {
 }
 
 // Handler is a http.Handler that can be used to handle requests.
-type Handler struct{ methodHandlers map[string]MethodHandler }
+type Handler struct {
+	methodHandlers map[string]MethodHandler
+	allowedMethods string
+}
 
-// NewHandler creates and returns a new Handler.
+// NewHandler creates and returns a new Handler. The value of the
+// Access-Control-Allow-Methods header is built once here as the set of methods
+// a Handler serves does not change between requests.
 func NewHandler(methodHandlers map[string]MethodHandler) Handler {
-	return Handler{methodHandlers: methodHandlers}
+	methods := make([]string, 0, len(methodHandlers))
+	for method := range methodHandlers {
+		methods = append(methods, method)
+	}
+	sort.Strings(methods)
+
+	return Handler{
+		methodHandlers: methodHandlers,
+		allowedMethods: strings.Join(
+			append([]string{http.MethodOptions}, methods...), ", ",
+		),
+	}
 }
 
 // ServeHTTP responds to HTTP requests.
 func (h Handler) ServeHTTP(w http.ResponseWriter, r *http.Request) {
 	// add cors headers
-	w.Header().Set("Access-Control-Allow-Origin", os.Getenv("CLIENTORIGIN"))
-	w.Header().Set("Access-Control-Allow-Headers", "Content-Type")
-	w.Header().Add("Access-Control-Allow-Credentials", "true")
+	header := w.Header()
+	header.Set("Access-Control-Allow-Origin", os.Getenv("CLIENTORIGIN"))
+	header.Set("Access-Control-Allow-Headers", "Content-Type")
+	header.Add("Access-Control-Allow-Credentials", "true")
 
 	// add allowed methods header
-	allowedMethods := make([]string, len(h.methodHandlers)+1)
-	allowedMethods[0] = http.MethodOptions
-	for method := range h.methodHandlers {
-		allowedMethods = append(allowedMethods, method)
-	}
-	w.Header().Add(allowedMethodsHeader(allowedMethods))
+	header.Add("Access-Control-Allow-Methods", h.allowedMethods)
 
 	// if method is OPTIONS, return now with set headers
 	if r.Method == http.MethodOptions {
@@ -50,19 +64,3 @@ func (h Handler) ServeHTTP(w http.ResponseWriter, r *http.Request) {
 	}
 	methodHandler.Handle(w, r, "")
 }
-
-// allowedMethodsHeader takes in a slice of allowed HTTP methods and returns the
-// key and the value for the Access-Control-Allow-Methods header.
-func allowedMethodsHeader(methods []string) (string, string) {
-	if len(methods) == 0 {
-		return "", ""
-	}
-
-	allowedMethods := ""
-	for _, m := range methods {
-		allowedMethods += m + ", "
-	}
-
-	return "Access-Control-Allow-Methods",
-		allowedMethods[:len(allowedMethods)-2]
-}
@@ -5,7 +5,6 @@ package api
 import (
 	"net/http"
 	"net/http/httptest"
-	"strings"
 	"testing"
 
 	"github.com/kxplxn/goteam/pkg/assert"
@@ -41,14 +40,10 @@ func TestHandler(t *testing.T) {
 				assert.Equal(
 					t.Error, resp.StatusCode, http.StatusMethodNotAllowed,
 				)
-				allowedMethods := resp.Header.Get(
-					"Access-Control-Allow-Methods",
+				assert.Equal(t.Error,
+					resp.Header.Get("Access-Control-Allow-Methods"),
+					"OPTIONS, DELETE, PATCH, POST",
 				)
-				for method := range sut.methodHandlers {
-					assert.True(t.Error,
-						strings.Contains(allowedMethods, method),
-					)
-				}
 			})
 		}
 	})
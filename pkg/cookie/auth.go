@@ -56,11 +56,31 @@ func (e EncoderAuth) Encode(auth Auth) (http.Cookie, error) {
 	}, nil
 }
 
-// AuthDecoder defines a type that can be used to decode an auth token.
-type AuthDecoder struct{ key []byte }
+// AuthDecoder defines a type that can be used to decode an auth token. Its JWT
+// parser and key function are created once and reused for every token it
+// decodes.
+type AuthDecoder struct {
+	parser  *jwt.Parser
+	keyFunc jwt.Keyfunc
+}
 
 // NewAuthDecoder creates and returns a new AuthDecoder.
-func NewAuthDecoder(key []byte) AuthDecoder { return AuthDecoder{key: key} }
+func NewAuthDecoder(key []byte) AuthDecoder {
+	return AuthDecoder{
+		parser: jwt.NewParser(
+			jwt.WithValidMethods([]string{jwt.SigningMethodHS256.Alg()}),
+		),
+		keyFunc: func(*jwt.Token) (any, error) { return key, nil },
+	}
+}
+
+// authClaims defines the claims of an auth token.
+type authClaims struct {
+	Username string `json:"username"`
+	IsAdmin  bool   `json:"isAdmin"`
+	TeamID   string `json:"teamID"`
+	jwt.RegisteredClaims
+}
 
 // Decode validates and decodes a raw JWT string into an Auth.
 func (d AuthDecoder) Decode(ck http.Cookie) (Auth, error) {
@@ -68,29 +88,16 @@ func (d AuthDecoder) Decode(ck http.Cookie) (Auth, error) {
 		return Auth{}, ErrInvalid
 	}
 
-	claims := jwt.MapClaims{}
-	if _, err := jwt.ParseWithClaims(
-		ck.Value, &claims, func(token *jwt.Token) (any, error) {
-			return d.key, nil
-		},
+	var claims authClaims
+	if _, err := d.parser.ParseWithClaims(
+		ck.Value, &claims, d.keyFunc,
 	); err != nil {
 		return Auth{}, err
 	}
 
-	username, ok := claims["username"].(string)
-	if !ok {
-		return Auth{}, ErrInvalid
-	}
-
-	isAdmin, ok := claims["isAdmin"].(bool)
-	if !ok {
-		return Auth{}, ErrInvalid
-	}
-
-	teamID, ok := claims["teamID"].(string)
-	if !ok {
+	if claims.Username == "" || claims.TeamID == "" {
 		return Auth{}, ErrInvalid
 	}
 
-	return NewAuth(username, isAdmin, teamID), nil
+	return NewAuth(claims.Username, claims.IsAdmin, claims.TeamID), nil
 }
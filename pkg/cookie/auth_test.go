@@ -95,6 +95,26 @@ func TestAuth(t *testing.T) {
 				wantTeamID:   "",
 				wantErr:      jwt.ErrTokenExpired,
 			},
+			{
+				name: "NoUsername",
+				token: "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJpc0FkbWluIjp0cnV" +
+					"lLCJ0ZWFtSUQiOiJ0ZWFtaWQifQ.V473sVTtYQj3xTyKgPS8TYVQmYIZ" +
+					"ZeIYQ1PN1ZIC13k",
+				wantUsername: "",
+				wantIsAdmin:  false,
+				wantTeamID:   "",
+				wantErr:      ErrInvalid,
+			},
+			{
+				name: "NoTeamID",
+				token: "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJpc0FkbWluIjp0cnV" +
+					"lLCJ1c2VybmFtZSI6ImJvYjEyMyJ9.-zaJ2zC1qOQL0guxeLehdmcnlk" +
+					"qhjTcP90tm6tj6II0",
+				wantUsername: "",
+				wantIsAdmin:  false,
+				wantTeamID:   "",
+				wantErr:      ErrInvalid,
+			},
 			{
 				name: "Success",
 				token: "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJib2FyZElEcyI6" +
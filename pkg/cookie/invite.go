@@ -48,24 +48,42 @@ func (e InviteEncoder) Encode(inv Invite) (http.Cookie, error) {
 	}, nil
 }
 
-// InviteDecoder defines a type that can be used to decode an invite token.
-type InviteDecoder struct{ key []byte }
+// InviteDecoder defines a type that can be used to decode an invite token. Its
+// JWT parser and key function are created once and reused for every token it
+// decodes.
+type InviteDecoder struct {
+	parser  *jwt.Parser
+	keyFunc jwt.Keyfunc
+}
 
 // NewInviteDecoder creates and returns a new InviteDecoder.
 func NewInviteDecoder(key []byte) InviteDecoder {
-	return InviteDecoder{key: key}
+	return InviteDecoder{
+		parser: jwt.NewParser(
+			jwt.WithValidMethods([]string{jwt.SigningMethodHS256.Alg()}),
+		),
+		keyFunc: func(*jwt.Token) (any, error) { return key, nil },
+	}
+}
+
+// inviteClaims defines the claims of an invite token.
+type inviteClaims struct {
+	TeamID string `json:"teamID"`
+	jwt.RegisteredClaims
 }
 
 // Decode validates and decodes a raw JWT string into an Invite.
 func (d InviteDecoder) Decode(token string) (Invite, error) {
-	claims := jwt.MapClaims{}
-	if _, err := jwt.ParseWithClaims(
-		token, &claims, func(token *jwt.Token) (any, error) {
-			return d.key, nil
-		},
+	var claims inviteClaims
+	if _, err := d.parser.ParseWithClaims(
+		token, &claims, d.keyFunc,
 	); err != nil {
 		return Invite{}, err
 	}
 
-	return NewInvite(claims["teamID"].(string)), nil
+	if claims.TeamID == "" {
+		return Invite{}, ErrInvalid
+	}
+
+	return NewInvite(claims.TeamID), nil
 }
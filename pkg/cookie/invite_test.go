@@ -85,6 +85,13 @@ func TestInvite(t *testing.T) {
 				wantTeamID: "",
 				wantErr:    jwt.ErrTokenExpired,
 			},
+			{
+				name: "NoTeamID",
+				token: "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJmb28iOiJiYXIifQ." +
+					"9dXraUGrVJv52omVxuZ7kkBBZWovmTadHvDXZF_vSf4",
+				wantTeamID: "",
+				wantErr:    ErrInvalid,
+			},
 			{
 				name: "Success",
 				token: "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJ0ZWFtSUQiOiJ0" +
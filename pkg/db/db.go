@@ -84,6 +84,15 @@ type DynamoItemPutter interface {
 	) (*dynamodb.PutItemOutput, error)
 }
 
+// DynamoItemUpdater defines a type that can be used to update attributes of an
+// item in a DynamoDB table. It is used to dependency-inject the DynamoDB client
+// into types that only need to write some of an item's attributes.
+type DynamoItemUpdater interface {
+	UpdateItem(
+		context.Context, *dynamodb.UpdateItemInput, ...func(*dynamodb.Options),
+	) (*dynamodb.UpdateItemOutput, error)
+}
+
 // DynamoItemDeleter defines a type that can be used to delete an item from a
 // DynamoDB table. It is used to dependency-inject the DynamoDB client into
 // Deleters.
@@ -111,3 +120,12 @@ type DynamoItemGetPutter interface {
 	DynamoItemGetter
 	DynamoItemPutter
 }
+
+// DynamoItemGetUpdater defines a type that can be used to get an item from and
+// update an item in a DynamoDB table. It is used to dependency-inject the
+// DynamoDB client into some inserters that operate on an item's internal
+// fields.
+type DynamoItemGetUpdater interface {
+	DynamoItemGetter
+	DynamoItemUpdater
+}
@@ -6,6 +6,7 @@ import (
 	"context"
 
 	"github.com/aws/aws-sdk-go-v2/service/dynamodb"
+	"github.com/aws/aws-sdk-go-v2/service/dynamodb/types"
 )
 
 // FakeRetriever is a test fake for Retriever.
@@ -20,6 +21,22 @@ func (f *FakeRetriever[T]) Retrieve(context.Context, string) (T, error) {
 	return f.Res, f.Err
 }
 
+// FakeRetrieverSeq is a test fake for Retriever that returns the next of its
+// results on each call, repeating the last one once they are exhausted.
+type FakeRetrieverSeq[T any] struct {
+	Res   []T
+	Errs  []error
+	calls int
+}
+
+// Retrieve discards params and returns the next item in FakeRetrieverSeq.Res
+// and FakeRetrieverSeq.Errs.
+func (f *FakeRetrieverSeq[T]) Retrieve(context.Context, string) (T, error) {
+	i := min(f.calls, len(f.Res)-1)
+	f.calls++
+	return f.Res[i], f.Errs[i]
+}
+
 // FakeInserter is a test fake for Inserter.
 type FakeInserter[T any] struct{ Err error }
 
@@ -90,6 +107,30 @@ func (f *FakeDynamoQueryer) Query(
 	return f.Out, f.Err
 }
 
+// FakeDynamoPagedQueryer is a test fake for DynamoQueryer that returns the
+// next of its Outs on each call, as DynamoDB does for a paginated query.
+type FakeDynamoPagedQueryer struct {
+	Outs []*dynamodb.QueryOutput
+	Err  error
+
+	// InStartKeys records the ExclusiveStartKey of each call's input.
+	InStartKeys []map[string]types.AttributeValue
+}
+
+// Query records the ExclusiveStartKey of the input and returns the next output
+// in Outs along with Err. Once Outs is exhausted, it returns an empty output
+// with no LastEvaluatedKey.
+func (f *FakeDynamoPagedQueryer) Query(
+	_ context.Context, in *dynamodb.QueryInput, _ ...func(*dynamodb.Options),
+) (*dynamodb.QueryOutput, error) {
+	i := len(f.InStartKeys)
+	f.InStartKeys = append(f.InStartKeys, in.ExclusiveStartKey)
+	if i >= len(f.Outs) {
+		return &dynamodb.QueryOutput{}, f.Err
+	}
+	return f.Outs[i], f.Err
+}
+
 // FakeDynamoItemPutter is a test fake for DynamoItemPutter.
 type FakeDynamoItemPutter struct {
 	Out *dynamodb.PutItemOutput
@@ -104,6 +145,24 @@ func (f *FakeDynamoItemPutter) PutItem(
 	return f.Out, f.Err
 }
 
+// FakeDynamoItemUpdater is a test fake for DynamoItemUpdater.
+type FakeDynamoItemUpdater struct {
+	In  *dynamodb.UpdateItemInput
+	Out *dynamodb.UpdateItemOutput
+	Err error
+}
+
+// UpdateItem records the input in the In field and returns Out and Err fields
+// set on FakeDynamoItemUpdater.
+func (f *FakeDynamoItemUpdater) UpdateItem(
+	_ context.Context,
+	in *dynamodb.UpdateItemInput,
+	_ ...func(*dynamodb.Options),
+) (*dynamodb.UpdateItemOutput, error) {
+	f.In = in
+	return f.Out, f.Err
+}
+
 // FakeDynamoItemDeleter is a test fake for DynamoItemDeleter.
 type FakeDynamoItemDeleter struct {
 	Out *dynamodb.DeleteItemOutput
@@ -120,17 +179,19 @@ func (f *FakeDynamoItemDeleter) DeleteItem(
 
 // FakeDynamoTransactWriter is a test fake for DynamoTransactWriter.
 type FakeDynamoTransactWriter struct {
+	In  *dynamodb.TransactWriteItemsInput
 	Out *dynamodb.TransactWriteItemsOutput
 	Err error
 }
 
-// TransactWriteItems discards the input parameters and returns Out and Err
+// TransactWriteItems records the input in the In field and returns Out and Err
 // fields set on FakeDynamoTransactWriter.
 func (f *FakeDynamoTransactWriter) TransactWriteItems(
-	context.Context,
-	*dynamodb.TransactWriteItemsInput,
-	...func(*dynamodb.Options),
+	_ context.Context,
+	in *dynamodb.TransactWriteItemsInput,
+	_ ...func(*dynamodb.Options),
 ) (*dynamodb.TransactWriteItemsOutput, error) {
+	f.In = in
 	return f.Out, f.Err
 }
 
@@ -138,6 +199,7 @@ func (f *FakeDynamoTransactWriter) TransactWriteItems(
 type FakeDynamoItemGetPutter struct {
 	OutGet *dynamodb.GetItemOutput
 	ErrGet error
+	InPut  *dynamodb.PutItemInput
 	OutPut *dynamodb.PutItemOutput
 	ErrPut error
 }
@@ -150,10 +212,41 @@ func (f *FakeDynamoItemGetPutter) GetItem(
 	return f.OutGet, f.ErrGet
 }
 
-// PutItem discards the input parameters and returns OutPut and ErrPut fields
-// set on FakeDynamoItemGetPutter.
+// PutItem records the input in the InPut field and returns OutPut and ErrPut
+// fields set on FakeDynamoItemGetPutter.
 func (f *FakeDynamoItemGetPutter) PutItem(
-	context.Context, *dynamodb.PutItemInput, ...func(*dynamodb.Options),
+	_ context.Context, in *dynamodb.PutItemInput, _ ...func(*dynamodb.Options),
 ) (*dynamodb.PutItemOutput, error) {
+	f.InPut = in
 	return f.OutPut, f.ErrPut
 }
+
+// FakeDynamoItemGetUpdater is a test fake for DynamoItemGetUpdater.
+type FakeDynamoItemGetUpdater struct {
+	InGet     *dynamodb.GetItemInput
+	OutGet    *dynamodb.GetItemOutput
+	ErrGet    error
+	InUpdate  *dynamodb.UpdateItemInput
+	OutUpdate *dynamodb.UpdateItemOutput
+	ErrUpdate error
+}
+
+// GetItem records the input in the InGet field and returns OutGet and ErrGet
+// fields set on FakeDynamoItemGetUpdater.
+func (f *FakeDynamoItemGetUpdater) GetItem(
+	_ context.Context, in *dynamodb.GetItemInput, _ ...func(*dynamodb.Options),
+) (*dynamodb.GetItemOutput, error) {
+	f.InGet = in
+	return f.OutGet, f.ErrGet
+}
+
+// UpdateItem records the input in the InUpdate field and returns OutUpdate and
+// ErrUpdate fields set on FakeDynamoItemGetUpdater.
+func (f *FakeDynamoItemGetUpdater) UpdateItem(
+	_ context.Context,
+	in *dynamodb.UpdateItemInput,
+	_ ...func(*dynamodb.Options),
+) (*dynamodb.UpdateItemOutput, error) {
+	f.InUpdate = in
+	return f.OutUpdate, f.ErrUpdate
+}
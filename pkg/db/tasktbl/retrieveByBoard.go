@@ -31,18 +31,35 @@ func (r RetrieverByBoard) Retrieve(
 		return nil, err
 	}
 
-	out, err := r.queryer.Query(ctx, &dynamodb.QueryInput{
+	in := &dynamodb.QueryInput{
 		TableName:                 aws.String(os.Getenv(tableName)),
 		IndexName:                 aws.String("BoardID-index"),
 		ExpressionAttributeNames:  expr.Names(),
 		ExpressionAttributeValues: expr.Values(),
 		KeyConditionExpression:    expr.KeyCondition(),
-	})
-	if err != nil {
-		return nil, err
 	}
 
-	var tasks []Task
-	err = attributevalue.UnmarshalListOfMaps(out.Items, &tasks)
-	return tasks, err
+	// query the table page by page, decoding each page as it arrives so that
+	// only one page of raw items is held in memory at a time - tasks starts
+	// empty rather than nil so that no tasks are encoded as [] and not null
+	tasks := []Task{}
+	for {
+		out, err := r.queryer.Query(ctx, in)
+		if err != nil {
+			return nil, err
+		}
+
+		var page []Task
+		if err = attributevalue.UnmarshalListOfMaps(
+			out.Items, &page,
+		); err != nil {
+			return nil, err
+		}
+		tasks = append(tasks, page...)
+
+		if len(out.LastEvaluatedKey) == 0 {
+			return tasks, nil
+		}
+		in.ExclusiveStartKey = out.LastEvaluatedKey
+	}
 }
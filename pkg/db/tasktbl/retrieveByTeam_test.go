@@ -8,6 +8,7 @@ import (
 	"strconv"
 	"testing"
 
+	"github.com/aws/aws-sdk-go-v2/feature/dynamodb/attributevalue"
 	"github.com/aws/aws-sdk-go-v2/service/dynamodb"
 	"github.com/aws/aws-sdk-go-v2/service/dynamodb/types"
 
@@ -151,4 +152,53 @@ func TestRetrieverByTeam(t *testing.T) {
 			}
 		})
 	}
+
+	t.Run("Empty", func(t *testing.T) {
+		queryer.Out = &dynamodb.QueryOutput{
+			Items: []map[string]types.AttributeValue{},
+		}
+		queryer.Err = nil
+
+		tasks, err := sut.Retrieve(context.Background(), "")
+		assert.Nil(t.Fatal, err)
+
+		// must not be nil so that it's encoded as [] and not null
+		assert.True(t.Error, tasks != nil)
+		assert.Equal(t.Error, len(tasks), 0)
+	})
+
+	t.Run("MultiplePages", func(t *testing.T) {
+		var items []map[string]types.AttributeValue
+		for _, task := range someTasks {
+			item, err := attributevalue.MarshalMap(task)
+			assert.Nil(t.Fatal, err)
+			items = append(items, item)
+		}
+		lastKey := map[string]types.AttributeValue{
+			"ID": &types.AttributeValueMemberS{Value: someTasks[0].ID},
+		}
+		pagedQueryer := &db.FakeDynamoPagedQueryer{
+			Outs: []*dynamodb.QueryOutput{
+				{Items: items[:1], LastEvaluatedKey: lastKey},
+				{Items: items[1:]},
+			},
+		}
+		sut := NewRetrieverByTeam(pagedQueryer)
+
+		tasks, err := sut.Retrieve(context.Background(), "")
+		assert.Nil(t.Fatal, err)
+
+		assert.Equal(t.Fatal, len(pagedQueryer.InStartKeys), 2)
+		assert.Equal(t.Error, len(pagedQueryer.InStartKeys[0]), 0)
+		assert.Equal(t.Error,
+			pagedQueryer.InStartKeys[1]["ID"].(*types.AttributeValueMemberS).
+				Value,
+			someTasks[0].ID,
+		)
+		assert.Equal(t.Fatal, len(tasks), len(someTasks))
+		for i, wt := range someTasks {
+			assert.Equal(t.Error, tasks[i].ID, wt.ID)
+			assert.Equal(t.Error, tasks[i].Order, wt.Order)
+		}
+	})
 }
@@ -6,7 +6,7 @@ import (
 	"os"
 
 	"github.com/aws/aws-sdk-go-v2/aws"
-	"github.com/aws/aws-sdk-go-v2/feature/dynamodb/attributevalue"
+	"github.com/aws/aws-sdk-go-v2/feature/dynamodb/expression"
 	"github.com/aws/aws-sdk-go-v2/service/dynamodb"
 	"github.com/aws/aws-sdk-go-v2/service/dynamodb/types"
 
@@ -14,24 +14,42 @@ import (
 )
 
 // Updater can be used to update a task in the task table.
-type Updater struct{ ItemPutter db.DynamoItemPutter }
+type Updater struct{ iupd db.DynamoItemUpdater }
 
 // NewUpdater creates and returns a new Updater.
-func NewUpdater(ip db.DynamoItemPutter) Updater {
-	return Updater{ItemPutter: ip}
+func NewUpdater(iupd db.DynamoItemUpdater) Updater {
+	return Updater{iupd: iupd}
 }
 
-// Update updates a task in the task table.
-func (p Updater) Update(ctx context.Context, task Task) error {
-	item, err := attributevalue.MarshalMap(task)
+// Update updates the title, the description, and the subtasks of a task in the
+// task table. The task's board, column, and order are left as-is since they are
+// only changed via MultiUpdater.
+func (u Updater) Update(ctx context.Context, task Task) error {
+	expr, err := expression.NewBuilder().
+		WithUpdate(expression.
+			Set(expression.Name("Title"), expression.Value(task.Title)).
+			Set(
+				expression.Name("Description"),
+				expression.Value(task.Description),
+			).
+			Set(expression.Name("Subtasks"), expression.Value(task.Subtasks)),
+		).
+		WithCondition(expression.AttributeExists(expression.Name("ID"))).
+		Build()
 	if err != nil {
 		return err
 	}
 
-	_, err = p.ItemPutter.PutItem(ctx, &dynamodb.PutItemInput{
-		TableName:           aws.String(os.Getenv(tableName)),
-		Item:                item,
-		ConditionExpression: aws.String("attribute_exists(ID)"),
+	_, err = u.iupd.UpdateItem(ctx, &dynamodb.UpdateItemInput{
+		TableName: aws.String(os.Getenv(tableName)),
+		Key: map[string]types.AttributeValue{
+			"TeamID": &types.AttributeValueMemberS{Value: task.TeamID},
+			"ID":     &types.AttributeValueMemberS{Value: task.ID},
+		},
+		UpdateExpression:          expr.Update(),
+		ConditionExpression:       expr.Condition(),
+		ExpressionAttributeNames:  expr.Names(),
+		ExpressionAttributeValues: expr.Values(),
 	})
 
 	var ex *types.ConditionalCheckFailedException
@@ -4,9 +4,9 @@ import (
 	"context"
 	"errors"
 	"os"
+	"strconv"
 
 	"github.com/aws/aws-sdk-go-v2/aws"
-	"github.com/aws/aws-sdk-go-v2/feature/dynamodb/attributevalue"
 	"github.com/aws/aws-sdk-go-v2/service/dynamodb"
 	"github.com/aws/aws-sdk-go-v2/service/dynamodb/types"
 
@@ -21,21 +21,47 @@ func NewMultiUpdater(tw db.DynamoTransactWriter) MultiUpdater {
 	return MultiUpdater{tw: tw}
 }
 
-// Update updates multiple tasks in the task table at once.
+// Update updates the board IDs, the column numbers, and the orders of multiple
+// tasks in the task table at once. Only these attributes are written so that
+// the rest of each task item is left as-is in the table.
 func (u MultiUpdater) Update(ctx context.Context, tasks []Task) error {
 	tableName := os.Getenv("TASK_TABLE_NAME")
 
+	// the update and the condition expressions are the same for every task so
+	// they are defined once here and only the values differ between tasks
+	var (
+		updExpr = aws.String(
+			"SET BoardID = :boardID, ColNo = :colNo, #order = :order",
+		)
+		condExpr = aws.String("attribute_exists(ID)")
+		names    = map[string]string{"#order": "Order"}
+	)
+
 	items := make([]types.TransactWriteItem, len(tasks))
 	for i, task := range tasks {
-		item, err := attributevalue.MarshalMap(task)
-		if err != nil {
-			return err
-		}
 		items[i] = types.TransactWriteItem{
-			Put: &types.Put{
-				TableName:           &tableName,
-				Item:                item,
-				ConditionExpression: aws.String("attribute_exists(ID)"),
+			Update: &types.Update{
+				TableName: &tableName,
+				Key: map[string]types.AttributeValue{
+					"TeamID": &types.AttributeValueMemberS{
+						Value: task.TeamID,
+					},
+					"ID": &types.AttributeValueMemberS{Value: task.ID},
+				},
+				UpdateExpression:         updExpr,
+				ConditionExpression:      condExpr,
+				ExpressionAttributeNames: names,
+				ExpressionAttributeValues: map[string]types.AttributeValue{
+					":boardID": &types.AttributeValueMemberS{
+						Value: task.BoardID,
+					},
+					":colNo": &types.AttributeValueMemberN{
+						Value: strconv.Itoa(task.ColNo),
+					},
+					":order": &types.AttributeValueMemberN{
+						Value: strconv.Itoa(task.Order),
+					},
+				},
 			},
 		}
 	}
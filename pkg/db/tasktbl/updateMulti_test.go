@@ -5,6 +5,7 @@ package tasktbl
 import (
 	"context"
 	"errors"
+	"strconv"
 	"testing"
 
 	"github.com/aws/aws-sdk-go-v2/service/dynamodb/types"
@@ -19,6 +20,24 @@ func TestMultiUpdater(t *testing.T) {
 	sut := NewMultiUpdater(tw)
 
 	errA := errors.New("failed to put item")
+	tasks := []Task{
+		{
+			TeamID:  "team1",
+			ID:      "task1",
+			BoardID: "board1",
+			ColNo:   1,
+			Order:   2,
+			Title:   "Do something!",
+		},
+		{
+			TeamID:  "team1",
+			ID:      "task2",
+			BoardID: "board2",
+			ColNo:   0,
+			Order:   3,
+			Title:   "Do something else!",
+		},
+	}
 
 	for _, c := range []struct {
 		name    string
@@ -38,9 +57,46 @@ func TestMultiUpdater(t *testing.T) {
 		t.Run(c.name, func(t *testing.T) {
 			tw.Err = c.ipErr
 
-			err := sut.Update(context.Background(), []Task{})
+			err := sut.Update(context.Background(), tasks)
 
 			assert.ErrIs(t.Fatal, err, c.wantErr)
+
+			// assert that only the board ID, the column number, and the
+			// order of each task are written
+			assert.Equal(t.Fatal, len(tw.In.TransactItems), len(tasks))
+			for i, task := range tasks {
+				upd := tw.In.TransactItems[i].Update
+				assert.True(t.Fatal, upd != nil)
+
+				assert.Equal(t.Error,
+					upd.Key["TeamID"].(*types.AttributeValueMemberS).Value,
+					task.TeamID,
+				)
+				assert.Equal(t.Error,
+					upd.Key["ID"].(*types.AttributeValueMemberS).Value,
+					task.ID,
+				)
+				assert.Equal(t.Error,
+					*upd.UpdateExpression,
+					"SET BoardID = :boardID, ColNo = :colNo, #order = :order",
+				)
+				assert.Equal(t.Error, len(upd.ExpressionAttributeValues), 3)
+				assert.Equal(t.Error,
+					upd.ExpressionAttributeValues[":boardID"].(*types.
+						AttributeValueMemberS).Value,
+					task.BoardID,
+				)
+				assert.Equal(t.Error,
+					upd.ExpressionAttributeValues[":colNo"].(*types.
+						AttributeValueMemberN).Value,
+					strconv.Itoa(task.ColNo),
+				)
+				assert.Equal(t.Error,
+					upd.ExpressionAttributeValues[":order"].(*types.
+						AttributeValueMemberN).Value,
+					strconv.Itoa(task.Order),
+				)
+			}
 		})
 	}
 }
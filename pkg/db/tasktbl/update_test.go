@@ -7,6 +7,7 @@ import (
 	"errors"
 	"testing"
 
+	"github.com/aws/aws-sdk-go-v2/feature/dynamodb/attributevalue"
 	"github.com/aws/aws-sdk-go-v2/service/dynamodb/types"
 	"github.com/aws/smithy-go"
 
@@ -15,32 +16,85 @@ import (
 )
 
 func TestUpdater(t *testing.T) {
-	ip := &db.FakeDynamoItemPutter{}
-	sut := NewUpdater(ip)
+	iupd := &db.FakeDynamoItemUpdater{}
+	sut := NewUpdater(iupd)
 
-	errA := errors.New("failed to put item")
+	errA := errors.New("failed to update item")
+	task := Task{
+		TeamID:      "team1",
+		ID:          "task1",
+		BoardID:     "board1",
+		ColNo:       2,
+		Title:       "Do something!",
+		Description: "Do it!",
+		Order:       3,
+		Subtasks:    []Subtask{{Title: "Do a thing", IsDone: true}},
+	}
 
 	for _, c := range []struct {
 		name    string
-		ipErr   error
+		iupdErr error
 		wantErr error
 	}{
-		{name: "Err", ipErr: errA, wantErr: errA},
+		{name: "Err", iupdErr: errA, wantErr: errA},
 		{
 			name: "NoItem",
-			ipErr: &smithy.OperationError{
+			iupdErr: &smithy.OperationError{
 				Err: &types.ConditionalCheckFailedException{},
 			},
 			wantErr: db.ErrNoItem,
 		},
-		{name: "OK", ipErr: nil, wantErr: nil},
+		{name: "OK", iupdErr: nil, wantErr: nil},
 	} {
 		t.Run(c.name, func(t *testing.T) {
-			ip.Err = c.ipErr
+			iupd.Err = c.iupdErr
 
-			err := sut.Update(context.Background(), Task{})
+			err := sut.Update(context.Background(), task)
 
 			assert.ErrIs(t.Fatal, err, c.wantErr)
+
+			// assert that the task is looked up by its key and only its title,
+			// description, and subtasks are written
+			in := iupd.In
+			assert.Equal(t.Error, len(in.Key), 2)
+			assert.Equal(t.Error,
+				in.Key["TeamID"].(*types.AttributeValueMemberS).Value,
+				task.TeamID,
+			)
+			assert.Equal(t.Error,
+				in.Key["ID"].(*types.AttributeValueMemberS).Value, task.ID,
+			)
+			assert.Equal(t.Error,
+				*in.UpdateExpression, "SET #1 = :0, #2 = :1, #3 = :2\n",
+			)
+			assert.Equal(t.Error,
+				*in.ConditionExpression, "attribute_exists (#0)",
+			)
+			assert.Equal(t.Error, len(in.ExpressionAttributeNames), 4)
+			assert.Equal(t.Error, in.ExpressionAttributeNames["#0"], "ID")
+			assert.Equal(t.Error, in.ExpressionAttributeNames["#1"], "Title")
+			assert.Equal(t.Error,
+				in.ExpressionAttributeNames["#2"], "Description",
+			)
+			assert.Equal(t.Error,
+				in.ExpressionAttributeNames["#3"], "Subtasks",
+			)
+			assert.Equal(t.Error,
+				in.ExpressionAttributeValues[":0"].(*types.
+					AttributeValueMemberS).Value,
+				task.Title,
+			)
+			assert.Equal(t.Error,
+				in.ExpressionAttributeValues[":1"].(*types.
+					AttributeValueMemberS).Value,
+				task.Description,
+			)
+			var subtasks []Subtask
+			assert.Nil(t.Fatal, attributevalue.Unmarshal(
+				in.ExpressionAttributeValues[":2"], &subtasks,
+			))
+			assert.Equal(t.Fatal, len(subtasks), 1)
+			assert.Equal(t.Error, subtasks[0], task.Subtasks[0])
 		})
 	}
 }
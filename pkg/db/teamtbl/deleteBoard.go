@@ -25,12 +25,14 @@ func NewBoardDeleter(igetput db.DynamoItemGetPutter) BoardDeleter {
 func (d BoardDeleter) Delete(
 	ctx context.Context, teamID string, boardID string,
 ) error {
+	tblName := aws.String(os.Getenv(tableName))
+
 	// get the existing team as-is
 	out, err := d.igetput.GetItem(ctx, &dynamodb.GetItemInput{
 		Key: map[string]types.AttributeValue{
 			"ID": &types.AttributeValueMemberS{Value: teamID},
 		},
-		TableName: aws.String(os.Getenv(tableName)),
+		TableName: tblName,
 	})
 	if err != nil {
 		return err
@@ -50,26 +52,20 @@ func (d BoardDeleter) Delete(
 		return db.ErrNoItem
 	}
 
-	// check board to be deleted exists and remove it from team's boards
+	// check board to be deleted exists and remove it from team's boards in a
+	// single pass
 	var found bool
 	newTeam := Team{
 		ID:      team.ID,
 		Members: team.Members,
-		Boards:  make([]Board, len(team.Boards)-1),
+		Boards:  make([]Board, 0, len(team.Boards)-1),
 	}
-	if len(team.Boards) == 1 {
-		if team.Boards[0].ID == boardID {
+	for _, b := range team.Boards {
+		if !found && b.ID == boardID {
 			found = true
+			continue
 		}
-	} else {
-		for i := 0; i < len(team.Boards)-1; i++ {
-			if team.Boards[i].ID == boardID {
-				found = true
-				i--
-				continue
-			}
-			newTeam.Boards[i] = team.Boards[i]
-		}
+		newTeam.Boards = append(newTeam.Boards, b)
 	}
 	if !found {
 		return db.ErrNoItem
@@ -84,7 +80,7 @@ func (d BoardDeleter) Delete(
 	// update the team based on the new team
 	_, err = d.igetput.PutItem(ctx, &dynamodb.PutItemInput{
 		Item:      newItem,
-		TableName: aws.String(os.Getenv(tableName)),
+		TableName: tblName,
 	})
 
 	return err
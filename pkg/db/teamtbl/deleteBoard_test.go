@@ -7,6 +7,7 @@ import (
 	"errors"
 	"testing"
 
+	"github.com/aws/aws-sdk-go-v2/feature/dynamodb/attributevalue"
 	"github.com/aws/aws-sdk-go-v2/service/dynamodb"
 	"github.com/aws/aws-sdk-go-v2/service/dynamodb/types"
 
@@ -42,6 +43,7 @@ func TestBoardDeleter(t *testing.T) {
 		outGetItem *dynamodb.GetItemOutput
 		errPutItem error
 		wantErr    error
+		wantBoards []string
 	}{
 		{
 			name:       "ErrGetItem",
@@ -83,6 +85,62 @@ func TestBoardDeleter(t *testing.T) {
 			outGetItem: &dynamodb.GetItemOutput{Item: itemA},
 			errPutItem: nil,
 			wantErr:    nil,
+			wantBoards: []string{},
+		},
+		{
+			name:       "OKMultipleBoards",
+			errGetItem: nil,
+			outGetItem: &dynamodb.GetItemOutput{
+				Item: map[string]types.AttributeValue{
+					"Boards": &types.AttributeValueMemberL{
+						Value: []types.AttributeValue{
+							itemA["Boards"].(*types.AttributeValueMemberL).
+								Value[0],
+							&types.AttributeValueMemberM{
+								Value: map[string]types.AttributeValue{
+									"ID": &types.AttributeValueMemberS{
+										Value: "otherBoardID",
+									},
+								},
+							},
+						},
+					},
+				},
+			},
+			errPutItem: nil,
+			wantErr:    nil,
+			wantBoards: []string{"otherBoardID"},
+		},
+		{
+			name:       "OKLastOfMultipleBoards",
+			errGetItem: nil,
+			outGetItem: &dynamodb.GetItemOutput{
+				Item: map[string]types.AttributeValue{
+					"Boards": &types.AttributeValueMemberL{
+						Value: []types.AttributeValue{
+							&types.AttributeValueMemberM{
+								Value: map[string]types.AttributeValue{
+									"ID": &types.AttributeValueMemberS{
+										Value: "board1",
+									},
+								},
+							},
+							&types.AttributeValueMemberM{
+								Value: map[string]types.AttributeValue{
+									"ID": &types.AttributeValueMemberS{
+										Value: "board2",
+									},
+								},
+							},
+							itemA["Boards"].(*types.AttributeValueMemberL).
+								Value[0],
+						},
+					},
+				},
+			},
+			errPutItem: nil,
+			wantErr:    nil,
+			wantBoards: []string{"board1", "board2"},
 		},
 	} {
 		t.Run(c.name, func(t *testing.T) {
@@ -93,6 +151,20 @@ func TestBoardDeleter(t *testing.T) {
 			err := sut.Delete(context.Background(), "", "boardID")
 
 			assert.Equal(t.Fatal, err, c.wantErr)
+			if c.wantErr != nil {
+				return
+			}
+
+			// assert that the other boards were written in their order
+			var team Team
+			assert.Nil(t.Fatal, attributevalue.UnmarshalMap(
+				igetput.InPut.Item, &team,
+			))
+			boardIDs := make([]string, len(team.Boards))
+			for i, b := range team.Boards {
+				boardIDs[i] = b.ID
+			}
+			assert.AllEqual(t.Error, boardIDs, c.wantBoards)
 		})
 	}
 }
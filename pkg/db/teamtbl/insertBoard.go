@@ -2,35 +2,52 @@ package teamtbl
 
 import (
 	"context"
+	"errors"
 	"os"
 
 	"github.com/aws/aws-sdk-go-v2/aws"
 	"github.com/aws/aws-sdk-go-v2/feature/dynamodb/attributevalue"
+	"github.com/aws/aws-sdk-go-v2/feature/dynamodb/expression"
 	"github.com/aws/aws-sdk-go-v2/service/dynamodb"
 	"github.com/aws/aws-sdk-go-v2/service/dynamodb/types"
 
 	"github.com/kxplxn/goteam/pkg/db"
 )
 
+// maxBoards is the maximum number of boards that a team can have.
+const maxBoards = 3
+
 // BoardInserter is a type that can be used to insert an item into a team's
 // boards.
-type BoardInserter struct{ igetput db.DynamoItemGetPutter }
+type BoardInserter struct{ igetupd db.DynamoItemGetUpdater }
 
 // NewBoardInserter creates and returns a new BoardInserter.
-func NewBoardInserter(igetput db.DynamoItemGetPutter) BoardInserter {
-	return BoardInserter{igetput: igetput}
+func NewBoardInserter(igetupd db.DynamoItemGetUpdater) BoardInserter {
+	return BoardInserter{igetupd: igetupd}
 }
 
 // Insert inserts the given board into the boards of the team with the given ID.
 func (i BoardInserter) Insert(
 	ctx context.Context, teamID string, board Board,
 ) error {
-	// get the existing team as-is
-	out, err := i.igetput.GetItem(ctx, &dynamodb.GetItemInput{
-		Key: map[string]types.AttributeValue{
-			"ID": &types.AttributeValueMemberS{Value: teamID},
-		},
-		TableName: aws.String(os.Getenv(tableName)),
+	tblName := aws.String(os.Getenv(tableName))
+
+	key := map[string]types.AttributeValue{
+		"ID": &types.AttributeValueMemberS{Value: teamID},
+	}
+
+	// get only the existing boards of the team
+	projExpr, err := expression.NewBuilder().WithProjection(
+		expression.NamesList(expression.Name("ID"), expression.Name("Boards")),
+	).Build()
+	if err != nil {
+		return err
+	}
+	out, err := i.igetupd.GetItem(ctx, &dynamodb.GetItemInput{
+		Key:                      key,
+		TableName:                tblName,
+		ProjectionExpression:     projExpr.Projection(),
+		ExpressionAttributeNames: projExpr.Names(),
 	})
 	if err != nil {
 		return err
@@ -58,24 +75,54 @@ func (i BoardInserter) Insert(
 	if dupKey {
 		return db.ErrDupKey
 	}
-	if count > 2 {
+	if count >= maxBoards {
 		return db.ErrLimitReached
 	}
 
-	// add the new board into the boards of the team
-	team.Boards = append(team.Boards, board)
-
-	// marshal back the team
-	newItem, err := attributevalue.MarshalMap(team)
+	// append the new board to the boards of the team, writing only the boards
+	updExpr, err := expression.NewBuilder().
+		WithUpdate(expression.Set(
+			expression.Name("Boards"),
+			expression.ListAppend(
+				expression.IfNotExists(
+					expression.Name("Boards"), expression.Value([]Board{}),
+				),
+				expression.Value([]Board{board}),
+			),
+		)).
+		// guard the limit on the write as well since the boards may have been
+		// changed by another request after they were read
+		WithCondition(expression.AttributeExists(expression.Name("ID")).And(
+			expression.Or(
+				expression.AttributeNotExists(expression.Name("Boards")),
+				expression.Size(expression.Name("Boards")).
+					LessThan(expression.Value(maxBoards)),
+			),
+		)).
+		Build()
 	if err != nil {
 		return err
 	}
-
-	// update the team
-	_, err = i.igetput.PutItem(ctx, &dynamodb.PutItemInput{
-		Item:      newItem,
-		TableName: aws.String(os.Getenv(tableName)),
+	_, err = i.igetupd.UpdateItem(ctx, &dynamodb.UpdateItemInput{
+		Key:                       key,
+		TableName:                 tblName,
+		UpdateExpression:          updExpr.Update(),
+		ConditionExpression:       updExpr.Condition(),
+		ExpressionAttributeNames:  updExpr.Names(),
+		ExpressionAttributeValues: updExpr.Values(),
+		ReturnValuesOnConditionCheckFailure: types.
+			ReturnValuesOnConditionCheckFailureAllOld,
 	})
 
+	// the condition fails either because the team no longer exists, in which
+	// case no item is returned, or because its boards reached the limit
+	var ex *types.ConditionalCheckFailedException
+	if errors.As(err, &ex) {
+		if ex.Item == nil {
+			return db.ErrNoItem
+		}
+		return db.ErrLimitReached
+	}
+
 	return err
 }
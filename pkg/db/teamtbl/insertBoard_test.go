@@ -7,16 +7,18 @@ import (
 	"errors"
 	"testing"
 
+	"github.com/aws/aws-sdk-go-v2/feature/dynamodb/attributevalue"
 	"github.com/aws/aws-sdk-go-v2/service/dynamodb"
 	"github.com/aws/aws-sdk-go-v2/service/dynamodb/types"
+	"github.com/aws/smithy-go"
 
 	"github.com/kxplxn/goteam/pkg/assert"
 	"github.com/kxplxn/goteam/pkg/db"
 )
 
 func TestBoardInserter(t *testing.T) {
-	igetput := &db.FakeDynamoItemGetPutter{}
-	sut := NewBoardInserter(igetput)
+	igetupd := &db.FakeDynamoItemGetUpdater{}
+	sut := NewBoardInserter(igetupd)
 
 	errA := errors.New("failed")
 	itemA := map[string]types.AttributeValue{
@@ -37,25 +39,25 @@ func TestBoardInserter(t *testing.T) {
 	}
 
 	for _, c := range []struct {
-		name       string
-		errGetItem error
-		outGetItem *dynamodb.GetItemOutput
-		errPutItem error
-		wantErr    error
+		name          string
+		errGetItem    error
+		outGetItem    *dynamodb.GetItemOutput
+		errUpdateItem error
+		wantErr       error
 	}{
 		{
-			name:       "ErrGetItem",
-			errGetItem: errA,
-			outGetItem: nil,
-			errPutItem: nil,
-			wantErr:    errA,
+			name:          "ErrGetItem",
+			errGetItem:    errA,
+			outGetItem:    nil,
+			errUpdateItem: nil,
+			wantErr:       errA,
 		},
 		{
-			name:       "ErrNoItemTeam",
-			errGetItem: nil,
-			outGetItem: &dynamodb.GetItemOutput{Item: nil},
-			errPutItem: nil,
-			wantErr:    db.ErrNoItem,
+			name:          "ErrNoItemTeam",
+			errGetItem:    nil,
+			outGetItem:    &dynamodb.GetItemOutput{Item: nil},
+			errUpdateItem: nil,
+			wantErr:       db.ErrNoItem,
 		},
 		{
 			name:       "ErrDupKey",
@@ -75,8 +77,8 @@ func TestBoardInserter(t *testing.T) {
 					},
 				},
 			},
-			errPutItem: nil,
-			wantErr:    db.ErrDupKey,
+			errUpdateItem: nil,
+			wantErr:       db.ErrDupKey,
 		},
 		{
 			name:       "ErrLimitReached",
@@ -110,32 +112,106 @@ func TestBoardInserter(t *testing.T) {
 					},
 				},
 			},
-			errPutItem: nil,
-			wantErr:    db.ErrLimitReached,
+			errUpdateItem: nil,
+			wantErr:       db.ErrLimitReached,
+		},
+		{
+			name:          "ErrUpdateItem",
+			errGetItem:    nil,
+			outGetItem:    &dynamodb.GetItemOutput{Item: itemA},
+			errUpdateItem: errA,
+			wantErr:       errA,
 		},
 		{
-			name:       "ErrPutItem",
+			name:       "ErrNoItemOnUpdate",
 			errGetItem: nil,
 			outGetItem: &dynamodb.GetItemOutput{Item: itemA},
-			errPutItem: errA,
-			wantErr:    errA,
+			errUpdateItem: &smithy.OperationError{
+				Err: &types.ConditionalCheckFailedException{Item: nil},
+			},
+			wantErr: db.ErrNoItem,
 		},
 		{
-			name:       "OK",
+			name:       "ErrLimitReachedOnUpdate",
 			errGetItem: nil,
 			outGetItem: &dynamodb.GetItemOutput{Item: itemA},
-			errPutItem: nil,
-			wantErr:    nil,
+			errUpdateItem: &smithy.OperationError{
+				Err: &types.ConditionalCheckFailedException{Item: itemA},
+			},
+			wantErr: db.ErrLimitReached,
+		},
+		{
+			name:          "OK",
+			errGetItem:    nil,
+			outGetItem:    &dynamodb.GetItemOutput{Item: itemA},
+			errUpdateItem: nil,
+			wantErr:       nil,
 		},
 	} {
 		t.Run(c.name, func(t *testing.T) {
-			igetput.ErrGet = c.errGetItem
-			igetput.OutGet = c.outGetItem
-			igetput.ErrPut = c.errPutItem
+			igetupd.ErrGet = c.errGetItem
+			igetupd.OutGet = c.outGetItem
+			igetupd.ErrUpdate = c.errUpdateItem
+
+			err := sut.Insert(context.Background(), "team1", Board{
+				ID: "board21", Name: "Board 21", Members: []string{"bob123"},
+			})
+
+			assert.ErrIs(t.Fatal, err, c.wantErr)
+			if c.wantErr != nil {
+				return
+			}
 
-			err := sut.Insert(context.Background(), "", Board{ID: "board21"})
+			// assert only the ID and the boards of the team were read
+			assert.Equal(t.Error,
+				igetupd.InGet.Key["ID"].(*types.AttributeValueMemberS).Value,
+				"team1",
+			)
+			assert.Equal(t.Error, *igetupd.InGet.ProjectionExpression, "#0, #1")
+			assert.Equal(t.Error, igetupd.InGet.ExpressionAttributeNames["#0"],
+				"ID")
+			assert.Equal(t.Error, igetupd.InGet.ExpressionAttributeNames["#1"],
+				"Boards")
 
-			assert.Equal(t.Fatal, err, c.wantErr)
+			// assert the board was appended to the boards of the team under
+			// the existence and the limit conditions
+			in := igetupd.InUpdate
+			assert.Equal(t.Error,
+				in.Key["ID"].(*types.AttributeValueMemberS).Value, "team1",
+			)
+			assert.Equal(t.Error, in.ExpressionAttributeNames["#0"], "ID")
+			assert.Equal(t.Error, in.ExpressionAttributeNames["#1"], "Boards")
+			assert.Equal(t.Error,
+				*in.UpdateExpression,
+				"SET #1 = list_append(if_not_exists(#1, :1), :2)\n",
+			)
+			assert.Equal(t.Error,
+				*in.ConditionExpression,
+				"(attribute_exists (#0)) AND ((attribute_not_exists (#1)) OR "+
+					"(size (#1) < :0))",
+			)
+			assert.Equal(t.Error,
+				in.ExpressionAttributeValues[":0"].(*types.
+					AttributeValueMemberN).Value,
+				"3",
+			)
+			assert.Equal(t.Error,
+				len(in.ExpressionAttributeValues[":1"].(*types.
+					AttributeValueMemberL).Value),
+				0,
+			)
+			var boards []Board
+			assert.Nil(t.Fatal, attributevalue.Unmarshal(
+				in.ExpressionAttributeValues[":2"], &boards,
+			))
+			assert.Equal(t.Fatal, len(boards), 1)
+			assert.Equal(t.Error, boards[0].ID, "board21")
+			assert.Equal(t.Error, boards[0].Name, "Board 21")
+			assert.AllEqual(t.Error, boards[0].Members, []string{"bob123"})
+			assert.Equal(t.Error,
+				in.ReturnValuesOnConditionCheckFailure,
+				types.ReturnValuesOnConditionCheckFailureAllOld,
+			)
 		})
 	}
 }
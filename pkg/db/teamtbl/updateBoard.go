@@ -25,12 +25,14 @@ func NewBoardUpdater(igetput db.DynamoItemGetPutter) BoardUpdater {
 func (d BoardUpdater) Update(
 	ctx context.Context, teamID string, board Board,
 ) error {
+	tblName := aws.String(os.Getenv(tableName))
+
 	// get the existing team as-is
 	out, err := d.igetput.GetItem(ctx, &dynamodb.GetItemInput{
 		Key: map[string]types.AttributeValue{
 			"ID": &types.AttributeValueMemberS{Value: teamID},
 		},
-		TableName: aws.String(os.Getenv(tableName)),
+		TableName: tblName,
 	})
 	if err != nil {
 		return err
@@ -72,7 +74,7 @@ func (d BoardUpdater) Update(
 	// update the team based on the new team
 	_, err = d.igetput.PutItem(ctx, &dynamodb.PutItemInput{
 		Item:      newItem,
-		TableName: aws.String(os.Getenv(tableName)),
+		TableName: tblName,
 	})
 
 	return err
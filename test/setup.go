@@ -162,28 +162,22 @@ func createTable(
 }
 
 // ensureTableActive checks whether the test table is created and its status is
-// "ACTIVE" every 500 milliseconds until it is true.
+// "ACTIVE" every 500 milliseconds, returning as soon as it is.
 func ensureTableActive(svc *dynamodb.Client, name string) error {
 	fmt.Println("ensuring all test tables are active")
-	var teamTableActive bool
 	for {
-		if !teamTableActive {
-			resp, err := svc.DescribeTable(
-				context.TODO(), &dynamodb.DescribeTableInput{TableName: &name},
-			)
-			if err != nil {
-				return err
-			}
-			if resp.Table.TableStatus == types.TableStatusActive {
-				teamTableActive = true
-			}
-		} else {
-			break
+		resp, err := svc.DescribeTable(
+			context.TODO(), &dynamodb.DescribeTableInput{TableName: &name},
+		)
+		if err != nil {
+			return err
+		}
+		if resp.Table.TableStatus == types.TableStatusActive {
+			return nil
 		}
 
 		time.Sleep(500 * time.Millisecond)
 	}
-	return nil
 }
 
 // tearDownNone is returned when there is nothing to tear down. This is done so
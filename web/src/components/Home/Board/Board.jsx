@@ -67,14 +67,14 @@ const Board = ({ handleActivate }) => {
     });
 
     try {
-      // update the source and the destination in the database
-      let sourceProm = sourceTasks.length > 0 && iSource !== iDest
-        ? TasksAPI.patch(sourceTasks)
-        : Promise.resolve()
-      let destProm = destinationTasks.length > 0
-        ? await TasksAPI.patch(destinationTasks)
-        : Promise.resolve()
-      await Promise.all([sourceProm, destProm])
+      // update the source and the destination in the database with a single
+      // request so that both columns are written in the same transaction
+      const tasks = iSource !== iDest
+        ? [...sourceTasks, ...destinationTasks]
+        : destinationTasks
+      if (tasks.length > 0) {
+        await TasksAPI.patch(tasks)
+      }
     } catch (err) {
       notify(
         'Unable to update tasks.',